@@ -126,28 +126,26 @@ class TestAttributeContainerFromNetCDF4(TestCase):
         cls.config_file = 'tests/unit/data/test_config.json'
         cls.fakesat_config = CFConfig('FakeSat', 'FAKE99', config_file=cls.config_file)
         cls.namespace = 'namespace string'
+        cls.output_dir = mkdtemp()
+        cls.netcdf4_path = write_skeleton_netcdf4(cls.output_dir)
 
-    def setUp(self):
-        """Set up properties to be reset for every test."""
-        self.output_dir = mkdtemp()
-
-    def tearDown(self):
-        """Perform clean-up after every test."""
-        rmtree(self.output_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Perform clean-up after all tests in the class."""
+        rmtree(cls.output_dir)
 
     def test_instantatiation_for_root_group(self):
         """Ensure an `AttributeContainerFromNetCDF4` can be created from a
         group.
 
         """
-        netcdf4_path = write_skeleton_netcdf4(self.output_dir)
         expected_attributes = {
             'collection_override': 'collection value',
             'global_override': 'GLOBAL',
             **netcdf4_global_attributes,
         }
 
-        with Dataset(netcdf4_path) as dataset:
+        with Dataset(self.netcdf4_path) as dataset:
             container = AttributeContainerFromNetCDF4(
                 dataset,
                 self.fakesat_config,
@@ -167,12 +165,11 @@ class TestAttributeContainerFromNetCDF4(TestCase):
         group.
 
         """
-        netcdf4_path = write_skeleton_netcdf4(self.output_dir)
         expected_attributes = {
             'collection_override': 'collection value',
         }
 
-        with Dataset(netcdf4_path) as dataset:
+        with Dataset(self.netcdf4_path) as dataset:
             container = AttributeContainerFromNetCDF4(
                 dataset['/group'],
                 self.fakesat_config,
@@ -192,7 +189,6 @@ class TestAttributeContainerFromNetCDF4(TestCase):
         variable.
 
         """
-        netcdf4_path = write_skeleton_netcdf4(self.output_dir)
         expected_attributes = {
             'collection_override': 'collection value',
             'coordinates': '/lat /lon',
@@ -200,7 +196,7 @@ class TestAttributeContainerFromNetCDF4(TestCase):
             'group_override': 'group value',
         }
 
-        with Dataset(netcdf4_path) as dataset:
+        with Dataset(self.netcdf4_path) as dataset:
             container = AttributeContainerFromNetCDF4(
                 dataset['/group/science2'],
                 self.fakesat_config,
@@ -217,9 +213,8 @@ class TestAttributeContainerFromNetCDF4(TestCase):
 
     def test_get_attribute_value(self):
         """Ensure attribute values can be correctly retrieved."""
-        netcdf4_path = write_skeleton_netcdf4(self.output_dir)
 
-        with Dataset(netcdf4_path) as dataset:
+        with Dataset(self.netcdf4_path) as dataset:
             container = AttributeContainerFromNetCDF4(
                 dataset['/group/science2'],
                 self.fakesat_config,
@@ -1,6 +1,8 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 from varinfo import CFConfig
+from varinfo.cf_config import read_config_file
 from varinfo.exceptions import (
     InvalidConfigFileFormatError,
     MissingConfigurationFileError,
@@ -72,6 +74,51 @@ class TestCFConfig(TestCase):
         self.assertSetEqual(set(), config.required_variables)
         self.assertDictEqual({}, config.metadata_overrides)
 
+    @patch('varinfo.cf_config.read_config_file', wraps=read_config_file)
+    def test_instantiation_parsed_config(self, mock_read_config_file):
+        """Ensure that an already parsed configuration can be supplied to the
+        `CFConfig` class, and that the configuration file is then not read
+        again.
+
+        """
+        parsed_config = read_config_file(self.test_config)
+        config = CFConfig(
+            self.mission, self.short_name, self.test_config, config=parsed_config
+        )
+
+        mock_read_config_file.assert_not_called()
+        self.assertSetEqual(
+            self.expected_excluded_science_variables,
+            config.excluded_science_variables,
+        )
+        self.assertSetEqual(self.required_variables, config.required_variables)
+        self.assertDictEqual(
+            self.expected_metadata_overrides,
+            config.metadata_overrides,
+        )
+
+    def test_read_config_file(self):
+        """Ensure the configuration file is parsed, or an empty dictionary is
+        returned when no file is specified. Missing or non-JSON files should
+        raise the appropriate exceptions.
+
+        """
+        with self.subTest('JSON configuration file'):
+            config = read_config_file(self.test_config)
+            self.assertIn('Mission', config)
+            self.assertIn('MetadataOverrides', config)
+
+        with self.subTest('No configuration file'):
+            self.assertDictEqual(read_config_file(None), {})
+
+        with self.subTest('Missing configuration file'):
+            with self.assertRaises(MissingConfigurationFileError):
+                read_config_file('bad_file_path.json')
+
+        with self.subTest('Non-JSON configuration file'):
+            with self.assertRaises(InvalidConfigFileFormatError):
+                read_config_file('tests/unit/data/ATL03_example.dmr')
+
     def test_instantiation_missing_configuration_file(self):
         """Ensure a MissingConfigurationFileError is raised when a path to a
         non-existent configuration file is specified.
@@ -11,6 +11,7 @@ from requests.exceptions import HTTPError, Timeout
 from varinfo.cmr_search import (
     get_granules,
     get_granule_link,
+    DOWNLOAD_MAX_ATTEMPTS,
     download_granule,
     get_edl_token_from_launchpad,
     get_edl_token_header,
@@ -436,6 +437,74 @@ class TestQuery(TestCase):
 
             self.assertEqual(actual_file_contents, expected_file_contents)
 
+    @patch('varinfo.cmr_search.time.sleep')
+    @patch('requests.get')
+    def test_download_granule_retries(self, mock_requests_get, mock_sleep):
+        """Ensure a request that fails with a transient server-side error is
+        retried with a backoff, and that other responses are not retried.
+
+        """
+        link = 'https://foo.gov/example.nc4'
+        expected_file_contents = 'Fake NetCDF-4 content'
+        mock_content = bytes(expected_file_contents, encoding='utf-8')
+
+        with self.subTest('Transient error is retried until successful'):
+            mock_requests_get.side_effect = [
+                self._mock_requests(status=503, content=b''),
+                self._mock_requests(status=502, content=b''),
+                self._mock_requests(content=mock_content),
+            ]
+
+            file_path = download_granule(
+                link,
+                auth_header=self.bearer_token_header,
+                out_directory=self.output_dir,
+            )
+
+            self.assertEqual(mock_requests_get.call_count, 3)
+            self.assertEqual(mock_sleep.call_count, 2)
+
+            with open(file_path, 'r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), expected_file_contents)
+
+        mock_requests_get.reset_mock()
+        mock_sleep.reset_mock()
+
+        with self.subTest('Retries are limited to the maximum attempts'):
+            failed_responses = [
+                self._mock_requests(status=503, content=b'')
+                for _ in range(DOWNLOAD_MAX_ATTEMPTS)
+            ]
+            failed_responses[-1].raise_for_status.side_effect = HTTPError('503')
+            mock_requests_get.side_effect = failed_responses
+
+            with self.assertRaises(GranuleDownloadException):
+                download_granule(
+                    link,
+                    auth_header=self.bearer_token_header,
+                    out_directory=self.output_dir,
+                )
+
+            self.assertEqual(mock_requests_get.call_count, DOWNLOAD_MAX_ATTEMPTS)
+            self.assertEqual(mock_sleep.call_count, DOWNLOAD_MAX_ATTEMPTS - 1)
+
+        mock_requests_get.reset_mock()
+        mock_sleep.reset_mock()
+
+        with self.subTest('Non-transient errors are not retried'):
+            mock_requests_get.side_effect = [
+                self._mock_requests(status=404, content=b''),
+            ]
+
+            download_granule(
+                link,
+                auth_header=self.bearer_token_header,
+                out_directory=self.output_dir,
+            )
+
+            mock_requests_get.assert_called_once()
+            mock_sleep.assert_not_called()
+
     @patch('requests.get')
     def test_requests_error(self, mock_requests_get):
         """Check if the GranuleDownloadException is raised when
@@ -444,7 +513,11 @@ class TestQuery(TestCase):
         link = 'https://foo.gov/example.nc4'
         mock_requests_get.return_value.side_effect = HTTPError('Wrong HTTP')
         with self.assertRaises(GranuleDownloadException):
-            download_granule(link, auth_header=self.bearer_token_header)
+            download_granule(
+                link,
+                auth_header=self.bearer_token_header,
+                out_directory=self.output_dir,
+            )
 
     @patch('requests.post')
     def test_get_edl_token_from_launchpad(self, mock_requests_post):
@@ -82,14 +82,12 @@ class TestGroupFromNetCDF4(TestCase):
         cls.config_file = 'tests/unit/data/test_config.json'
         cls.fakesat_config = CFConfig('FakeSat', 'FAKE99', config_file=cls.config_file)
         cls.namespace = 'namespace string'
+        cls.output_dir = mkdtemp()
 
-    def setUp(self):
-        """Set up properties to be reset for every test."""
-        self.output_dir = mkdtemp()
-
-    def tearDown(self):
-        """Perform clean-up after every test."""
-        rmtree(self.output_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Perform clean-up after all tests in the class."""
+        rmtree(cls.output_dir)
 
     def test_group_instantiation(self):
         """Ensure a group can be created from an input NetCDF-4 file."""
@@ -65,6 +65,15 @@ class TestUmmVar(TestCase):
         with open('tests/unit/data/umm_var_json_schema_1.8.2.json', 'r') as schema_file:
             cls.umm_var_schema = json.load(schema_file)
 
+        cls.netcdf4_dir = mkdtemp()
+        cls.netcdf4_file = write_skeleton_netcdf4(cls.netcdf4_dir)
+        cls.netcdf4_varinfo = VarInfoFromNetCDF4(cls.netcdf4_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove fixtures shared between all tests in the class."""
+        rmtree(cls.netcdf4_dir)
+
     def setUp(self):
         """Define test fixtures that should be unique per test."""
         self.tmp_dir = mkdtemp()
@@ -342,8 +351,8 @@ class TestUmmVar(TestCase):
 
     def test_get_dimensions(self):
         """Ensure dimensions for a variable are identified and returned."""
-        netcdf4_file = write_skeleton_netcdf4(self.tmp_dir)
-        var_info = VarInfoFromNetCDF4(netcdf4_file)
+        var_info = self.netcdf4_varinfo
+
         with self.subTest('Variable with dimensions returns all of them'):
             self.assertListEqual(
                 get_dimensions(var_info, var_info.get_variable('/science1')),
@@ -369,8 +378,7 @@ class TestUmmVar(TestCase):
         indicate the 2-element dimension for the bounds variable.
 
         """
-        netcdf4_file = write_skeleton_netcdf4(self.tmp_dir)
-        var_info = VarInfoFromNetCDF4(netcdf4_file)
+        var_info = self.netcdf4_varinfo
         variable = var_info.get_variable('/science1')
 
         with self.subTest('Temporal dimension variable'):
@@ -450,8 +458,9 @@ class TestUmmVar(TestCase):
         bounds 2-element dimensions. The default value should be None.
 
         """
-        netcdf4_file = write_skeleton_netcdf4(self.tmp_dir)
-        var_info = VarInfoFromNetCDF4(netcdf4_file)
+        # This test mutates the VarInfo instance, so does not use the shared
+        # `self.netcdf4_varinfo`:
+        var_info = VarInfoFromNetCDF4(self.netcdf4_file)
 
         # Overwrite the shape attribute of a variable to ensure tests with that
         # variable extract information from the dimension shape:
@@ -726,6 +735,10 @@ class TestUmmVar(TestCase):
 
             self.assertDictEqual(saved_output, umm_var_record)
 
+        with self.subTest('Characters invalid in a file name are replaced.'):
+            export_umm_var_to_json({'Name': 'Grid/time:bnds\\0'}, self.tmp_dir)
+            self.assertTrue(exists(f'{self.tmp_dir}/Grid_time_bnds_0.json'))
+
         with self.subTest('Specified directory is a file, raises exception.'):
             with self.assertRaises(InvalidExportDirectory):
                 other_file_path = f'{self.tmp_dir}/other_file.txt'
@@ -9,12 +9,15 @@ import numpy as np
 
 from varinfo.exceptions import DmrNamespaceError
 from varinfo.utilities import (
+    DAP4_TO_NUMPY_MAP,
+    get_dap4_variable_tags,
     get_full_path_netcdf4_attribute,
     get_full_path_xml_attribute,
     get_xml_attribute,
     get_xml_attribute_value,
     get_xml_container_attribute,
     get_xml_namespace,
+    parse_xml_attribute,
     recursive_get,
     split_attribute_path,
 )
@@ -28,12 +31,11 @@ class TestUtilities(TestCase):
     @classmethod
     def setUpClass(cls):
         cls.namespace = 'namespace_string'
+        cls.output_dir = mkdtemp()
 
-    def setUp(self):
-        self.output_dir = mkdtemp()
-
-    def tearDown(self):
-        rmtree(self.output_dir)
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.output_dir)
 
     def test_recursive_get(self):
         """Can retrieve a nested dictionary value, or account for missing
@@ -45,6 +47,7 @@ class TestUtilities(TestCase):
             ['Nested', {'a': {'b': 'c'}}, ['a', 'b'], 'c'],
             ['Missing nested data', {'a': {'c': 'd'}}, ['a', 'b'], None],
             ['Missing top level', {'b': {'c': 'd'}}, ['a', 'c'], None],
+            ['Non-dictionary intermediate', {'a': 'b'}, ['a', 'c'], None],
         ]
 
         for description, test_dictionary, keys, expected_output in test_args:
@@ -93,6 +96,19 @@ class TestUtilities(TestCase):
             with self.assertRaises(DmrNamespaceError):
                 get_xml_namespace(element)
 
+    def test_get_dap4_variable_tags(self):
+        """Ensure all DAP4 variable types are qualified with the namespace,
+        and that the same set is returned for repeated calls.
+
+        """
+        variable_tags = get_dap4_variable_tags(self.namespace)
+
+        self.assertSetEqual(
+            variable_tags,
+            {f'{self.namespace}{variable_type}' for variable_type in DAP4_TO_NUMPY_MAP},
+        )
+        self.assertIs(get_dap4_variable_tags(self.namespace), variable_tags)
+
     def test_get_xml_attribute(self):
         """Ensure the value of an XML attribute is correctly retrieved, or
         that the default value is returned, where given. This function
@@ -157,6 +173,18 @@ class TestUtilities(TestCase):
                 self.assertIsInstance(attribute_value, expected_type)
                 self.assertEqual(attribute_value, expected_value)
 
+        with self.subTest('Attribute name containing quotation marks'):
+            quoted_variable = ET.fromstring(
+                f'<{self.namespace}Int64 name="test_variable">'
+                f'  <{self.namespace}Attribute name=\'say "hi"\' type="String">'
+                f'    <{self.namespace}Value>hi</{self.namespace}Value>'
+                f'  </{self.namespace}Attribute>'
+                f'</{self.namespace}Int64>'
+            )
+            self.assertEqual(
+                get_xml_attribute(quoted_variable, 'say "hi"', self.namespace), 'hi'
+            )
+
         with self.subTest('Multiple values are retrieved'):
             attribute_value = get_xml_attribute(variable, 'multi', self.namespace)
 
@@ -167,6 +195,51 @@ class TestUtilities(TestCase):
             for value in attribute_value:
                 self.assertIsInstance(value, np.float64)
 
+    def test_parse_xml_attribute(self):
+        """Ensure the value of an Attribute element that has already been
+        located is correctly cast to its type, or extracted as a dictionary
+        for a container. Absent Value tags should return the default value.
+
+        """
+        with self.subTest('Float64 attribute is cast to correct type.'):
+            attribute = ET.fromstring(
+                f'<{self.namespace}Attribute name="valid_attr" type="Float64">'
+                f'  <{self.namespace}Value>12.0</{self.namespace}Value>'
+                f'</{self.namespace}Attribute>'
+            )
+            attribute_value = parse_xml_attribute(attribute, self.namespace)
+            self.assertIsInstance(attribute_value, np.float64)
+            self.assertEqual(attribute_value, 12.0)
+
+        with self.subTest('Attribute omitting type property is a string.'):
+            attribute = ET.fromstring(
+                f'<{self.namespace}Attribute name="no_type">'
+                f'  <{self.namespace}Value>12.0</{self.namespace}Value>'
+                f'</{self.namespace}Attribute>'
+            )
+            self.assertEqual(parse_xml_attribute(attribute, self.namespace), '12.0')
+
+        with self.subTest('Absent Value tag uses default.'):
+            attribute = ET.fromstring(
+                f'<{self.namespace}Attribute name="no_value" type="String">'
+                f'</{self.namespace}Attribute>'
+            )
+            self.assertEqual(
+                parse_xml_attribute(attribute, self.namespace, 'default'), 'default'
+            )
+
+        with self.subTest('Container attribute returns a dictionary.'):
+            attribute = ET.fromstring(
+                f'<{self.namespace}Attribute name="container" type="Container">'
+                f'  <{self.namespace}Attribute name="nested" type="Float64">'
+                f'    <{self.namespace}Value>1.0</{self.namespace}Value>'
+                f'  </{self.namespace}Attribute>'
+                f'</{self.namespace}Attribute>'
+            )
+            self.assertDictEqual(
+                parse_xml_attribute(attribute, self.namespace), {'nested': 1.0}
+            )
+
     def test_get_xml_attribute_value(self):
         """Ensure a single or list value can be extracted from a given XML
         Attribute tag. If there are no child Value tags, the default value
@@ -1,6 +1,8 @@
+from os.path import join as path_join
 from shutil import rmtree
 from tempfile import mkdtemp
 from unittest import TestCase
+from unittest.mock import patch
 import re
 
 from varinfo import VarInfoFromDmr, VarInfoFromNetCDF4
@@ -8,7 +10,9 @@ from varinfo.exceptions import (
     InvalidConfigFileFormatError,
     MissingConfigurationFileError,
 )
-from tests.utilities import write_dmr, write_skeleton_netcdf4
+from varinfo.cf_config import read_config_file
+from varinfo.utilities import get_xml_namespace
+from tests.utilities import write_skeleton_netcdf4
 
 
 class TestVarInfoFromDmr(TestCase):
@@ -22,19 +26,100 @@ class TestVarInfoFromDmr(TestCase):
         """
         cls.test_config_file = 'tests/unit/data/test_config.json'
         cls.namespace = 'namespace_string'
+        cls.dmr_header = f'<Dataset xmlns="{cls.namespace}">'
+        cls.dmr_footer = '</Dataset>'
         cls.mock_geographic_dmr = 'tests/unit/data/mock_geographic.dmr'
         cls.mock_dmr_two = 'tests/unit/data/mock_dataset_two.dmr'
+        cls.mock_dmr_two_varinfo = VarInfoFromDmr(
+            cls.mock_dmr_two, config_file=cls.test_config_file
+        )
         cls.mock_geo_and_projected_dmr = 'tests/unit/data/mock_geo_and_projected.dmr'
-        cls.dimension_grouping_dmr = 'tests/unit/data/dimension_grouping.dmr'
+        cls.mock_geo_and_projected_varinfo = VarInfoFromDmr(
+            cls.mock_geo_and_projected_dmr, config_file=cls.test_config_file
+        )
+        cls.dimension_grouping_varinfo = VarInfoFromDmr(
+            'tests/unit/data/dimension_grouping.dmr', config_file=cls.test_config_file
+        )
         cls.merra_varinfo = VarInfoFromDmr(
             'tests/unit/data/M2I3NPASM_example.dmr', short_name='M2I3NPASM'
         )
+        cls.required_dimensions_dmr = (
+            f'{cls.dmr_header}'
+            '  <Attribute name="short_name">'
+            '    <Value>FAKE123A</Value>'
+            '  </Attribute>'
+            '  <Dimension name="latitude" size="1800"/>'
+            '  <Dimension name="longitude" size="3600"/>'
+            '  <Float64 name="science_one">'
+            '    <Dim name="/latitude"/>'
+            '  </Float64>'
+            '  <Float64 name="science_two">'
+            '    <Dim name="/longitude"/>'
+            '  </Float64>'
+            '  <Float64 name="science_three">'
+            '  </Float64>'
+            '  <Float64 name="longitude">'
+            '  </Float64>'
+            '  <Float64 name="latitude">'
+            '  </Float64>'
+            '  <Float64 name="lat_bnds">'
+            '    <Dim name="latv" size="2"/>'
+            '    <Dim name="latitude" size="1800"/>'
+            '  </Float64>'
+            f'{cls.dmr_footer}'
+        )
+        cls.temporal_dimensions_dmr = (
+            f'{cls.dmr_header}'
+            '  <Attribute name="short_name">'
+            '    <Value>FAKE123A</Value>'
+            '  </Attribute>'
+            '    <Float64 name="science_one">'
+            '      <Dim name="/latitude"/>'
+            '      <Dim name="/longitude"/>'
+            '      <Dim name="/time"/>'
+            '    </Float64>'
+            '    <Float64 name="science_two">'
+            '      <Dim name="x"/>'
+            '      <Dim name="y"/>'
+            '    </Float64>'
+            '    <Float64 name="science_three">'
+            '    </Float64>'
+            '    <Float64 name="science_four">'
+            '      <Dim name="non-existent"/>'
+            '    </Float64>'
+            '    <Int32 name="time">'
+            '      <Attribute name="units" type="String">'
+            '        <Value>minutes since 1980-01-02 00:30:00 </Value>'
+            '      </Attribute>'
+            '    </Int32>'
+            '    <Float64 name="latitude">'
+            '      <Attribute name="units" type="String">'
+            '        <Value>degrees_north</Value>'
+            '      </Attribute>'
+            '    </Float64>'
+            '    <Float64 name="longitude">'
+            '      <Attribute name="units" type="String">'
+            '        <Value>degrees_east</Value>'
+            '      </Attribute>'
+            '    </Float64>'
+            '    <Float64 name="x">'
+            '      <Attribute name="units" type="String">'
+            '        <Value>m</Value>'
+            '      </Attribute>'
+            '    </Float64>'
+            '    <Float64 name="y">'
+            '      <Attribute name="units" type="String">'
+            '        <Value>m</Value>'
+            '      </Attribute>'
+            '    </Float64>'
+            f'{cls.dmr_footer}'
+        )
+        cls.output_dir = mkdtemp()
 
-    def setUp(self):
-        self.output_dir = mkdtemp()
-
-    def tearDown(self):
-        rmtree(self.output_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Perform clean-up after all tests in the class."""
+        rmtree(cls.output_dir)
 
     def test_var_info_short_name(self):
         """Ensure an instance of the VarInfo class correctly identifies a
@@ -123,49 +208,163 @@ class TestVarInfoFromDmr(TestCase):
 
         for global_attributes in test_attributes:
             with self.subTest(global_attributes):
-                mock_dmr = (
-                    f'<Dataset xmlns="{self.namespace}">'
-                    f'{global_attributes}'
-                    '</Dataset>'
-                )
-                dmr_path = write_dmr(self.output_dir, mock_dmr)
+                mock_dmr = self.dmr_header + global_attributes + self.dmr_footer
 
-                dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
+                dataset = VarInfoFromDmr.from_string(
+                    mock_dmr, config_file=self.test_config_file
+                )
 
                 self.assertEqual(dataset.short_name, short_name)
 
-        with self.subTest('No short name'):
-            mock_dmr = f'<Dataset xmlns="{self.namespace}"></Dataset>'
-            dmr_path = write_dmr(self.output_dir, mock_dmr)
+        with self.subTest('Short name given in call overrides metadata'):
+            metadata_short_name_dmr = (
+                self.dmr_header + root_group_short_name + self.dmr_footer
+            )
+            dataset = VarInfoFromDmr.from_string(
+                metadata_short_name_dmr,
+                short_name='ATL08',
+                config_file=self.test_config_file,
+            )
+            self.assertEqual(dataset.short_name, 'ATL08')
 
-            dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
+        no_short_name_dmr = self.dmr_header + self.dmr_footer
+
+        with self.subTest('No short name'):
+            dataset = VarInfoFromDmr.from_string(
+                no_short_name_dmr, config_file=self.test_config_file
+            )
 
             self.assertIsNone(dataset.short_name)
 
         with self.subTest('No short name in metadata, but given in call'):
-            mock_dmr = f'<Dataset xmlns="{self.namespace}"></Dataset>'
-            dmr_path = write_dmr(self.output_dir, mock_dmr)
-
-            dataset = VarInfoFromDmr(
-                dmr_path, short_name='ATL03', config_file=self.test_config_file
+            dataset = VarInfoFromDmr.from_string(
+                no_short_name_dmr,
+                short_name='ATL03',
+                config_file=self.test_config_file,
             )
 
             self.assertEqual(dataset.short_name, 'ATL03')
 
-        with self.subTest('Short name given in call overrides metadata'):
-            mock_dmr = (
-                f'<Dataset xmlns="{self.namespace}">'
-                '  <Attribute name="short_name">'
-                f'    <Value>ATL03</Value>'
-                '  </Attribute>'
-                '</Dataset>'
-            )
-            dmr_path = write_dmr(self.output_dir, mock_dmr)
+    def test_var_info_from_string(self):
+        """Ensure an instance of `VarInfoFromDmr` can be created from the
+        content of a `.dmr`, and that it matches an instance created from
+        the equivalent file.
 
-            dataset = VarInfoFromDmr(
-                dmr_path, short_name='ATL08', config_file=self.test_config_file
+        """
+        with open(self.mock_dmr_two, encoding='utf-8') as file_handler:
+            dmr_content = file_handler.read()
+
+        from_file = self.mock_dmr_two_varinfo
+        from_string = VarInfoFromDmr.from_string(
+            dmr_content, config_file=self.test_config_file
+        )
+
+        self.assertIsInstance(from_string, VarInfoFromDmr)
+        self.assertEqual(from_string.short_name, from_file.short_name)
+        self.assertEqual(from_string.mission, from_file.mission)
+        self.assertSetEqual(
+            from_string.get_all_variables(), from_file.get_all_variables()
+        )
+        self.assertSetEqual(
+            from_string.get_science_variables(), from_file.get_science_variables()
+        )
+
+    def test_var_info_from_string_non_ascii(self):
+        """Ensure non-ASCII characters are retained when `.dmr` content is
+        supplied as a string. OPeNDAP `.dmr` responses declare an ISO-8859-1
+        encoding, which should not change how the string is decoded.
+
+        """
+        dmr_content = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            f'{self.dmr_header}'
+            '<Float64 name="science">'
+            '<Attribute name="units" type="String"><Value>café µm</Value></Attribute>'
+            '</Float64>'
+            f'{self.dmr_footer}'
+        )
+
+        dataset = VarInfoFromDmr.from_string(
+            dmr_content, config_file=self.test_config_file
+        )
+
+        self.assertEqual(
+            dataset.get_variable('/science').get_attribute_value('units'), 'café µm'
+        )
+
+    def test_var_info_dmr_file_non_ascii(self):
+        """Ensure a `.dmr` file is decoded as UTF-8, even though the XML
+        declaration in OPeNDAP `.dmr` responses states an ISO-8859-1
+        encoding.
+
+        """
+        dmr_path = path_join(self.output_dir, 'non_ascii.dmr')
+
+        with open(dmr_path, 'w', encoding='utf-8') as file_handler:
+            file_handler.write(
+                '<?xml version="1.0" encoding="ISO-8859-1"?>'
+                f'{self.dmr_header}'
+                '<Float64 name="science">'
+                '<Attribute name="units" type="String"><Value>café µm</Value>'
+                '</Attribute>'
+                '</Float64>'
+                f'{self.dmr_footer}'
             )
-            self.assertEqual(dataset.short_name, 'ATL08')
+
+        dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
+
+        self.assertEqual(
+            dataset.get_variable('/science').get_attribute_value('units'), 'café µm'
+        )
+
+    @patch('varinfo.var_info.get_xml_namespace', wraps=get_xml_namespace)
+    def test_var_info_namespace(self, mock_get_xml_namespace):
+        """Ensure the XML namespace is extracted from the root element only
+        once per `.dmr`, and that the same value is used for all groups and
+        variables.
+
+        """
+        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+
+        mock_get_xml_namespace.assert_called_once_with(dataset.dataset)
+        self.assertEqual(dataset.namespace, get_xml_namespace(dataset.dataset))
+
+        for group in dataset.groups.values():
+            self.assertEqual(group.namespace, dataset.namespace)
+
+        for variable in dataset.variables.values():
+            self.assertEqual(variable.namespace, dataset.namespace)
+
+    @patch('varinfo.var_info.read_config_file', wraps=read_config_file)
+    @patch('varinfo.cf_config.read_config_file', wraps=read_config_file)
+    def test_var_info_config_file_read_once(
+        self, mock_cf_config_read, mock_var_info_read
+    ):
+        """Ensure the configuration file is only read once per `VarInfo`
+        instance, with the parsed contents reused by the `CFConfig` instance.
+
+        """
+        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+
+        mock_var_info_read.assert_called_once_with(self.test_config_file)
+        mock_cf_config_read.assert_not_called()
+        self.assertEqual(dataset.cf_config.mission, 'FakeSat')
+        self.assertGreater(len(dataset.cf_config.metadata_overrides), 0)
+
+    def test_var_info_paths_are_interned(self):
+        """Ensure that references to other variables are the same string
+        objects as the paths used to key those variables, rather than equal
+        copies.
+
+        """
+        dataset = self.mock_dmr_two_varinfo
+        variable_paths = {path: path for path in dataset.variables}
+
+        self.assertGreater(len(dataset.references), 0)
+
+        for reference in dataset.references:
+            with self.subTest(reference):
+                self.assertIs(reference, variable_paths[reference])
 
     def test_var_info_mission(self):
         """Ensure VarInfo can identify the correct mission given a collection
@@ -182,18 +381,20 @@ class TestVarInfoFromDmr(TestCase):
             [None, None],
         ]
 
+        dmr_template = (
+            f'{self.dmr_header}'
+            '  <Attribute name="short_name">'
+            '    <Value>{short_name}</Value>'
+            '  </Attribute>'
+            f'{self.dmr_footer}'
+        )
+
         for short_name, expected_mission in test_args:
             with self.subTest(short_name):
-                mock_dmr = (
-                    f'<Dataset xmlns="{self.namespace}">'
-                    '  <Attribute name="short_name">'
-                    f'    <Value>{short_name}</Value>'
-                    '  </Attribute>'
-                    '</Dataset>'
+                dataset = VarInfoFromDmr.from_string(
+                    dmr_template.format(short_name=short_name),
+                    config_file=self.test_config_file,
                 )
-                dmr_path = write_dmr(self.output_dir, mock_dmr)
-
-                dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
 
                 self.assertEqual(dataset.mission, expected_mission)
 
@@ -301,7 +502,7 @@ class TestVarInfoFromDmr(TestCase):
         metadata attribute overrides in the CFConfig class.
 
         """
-        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+        dataset = self.mock_dmr_two_varinfo
 
         expected_global_attributes = {
             'collection_override': 'collection value',
@@ -356,7 +557,7 @@ class TestVarInfoFromDmr(TestCase):
         """
         history = '2021-06-24T01:02:03+00:00 Service v0.0.1'
         mock_dmr = (
-            f'<Dataset xmlns="{self.namespace}">'
+            f'{self.dmr_header}'
             '  <Attribute name="HDF5_GLOBAL" type="Container">'
             '    <Attribute name="short_name" type="String">'
             '      <Value>FAKESAT1</Value>'
@@ -368,10 +569,11 @@ class TestVarInfoFromDmr(TestCase):
             '      <Value>-90.0</Value>'
             '    </Attribute>'
             '  </Attribute>'
-            '</Dataset>'
+            f'{self.dmr_footer}'
+        )
+        dataset = VarInfoFromDmr.from_string(
+            mock_dmr, config_file=self.test_config_file
         )
-        dmr_path = write_dmr(self.output_dir, mock_dmr)
-        dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
 
         expected_globals = {
             'HDF5_GLOBAL': {
@@ -393,7 +595,7 @@ class TestVarInfoFromDmr(TestCase):
         variables.
 
         """
-        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+        dataset = self.mock_dmr_two_varinfo
 
         expected_variables = {
             '/science/interesting_thing',
@@ -412,11 +614,24 @@ class TestVarInfoFromDmr(TestCase):
         associated instance of the `CFConfig` class.
 
         """
-        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+        dataset = self.mock_dmr_two_varinfo
 
         science_variables = dataset.get_science_variables()
         self.assertEqual(science_variables, {'/science/interesting_thing'})
 
+    def test_var_info_get_variables_with_coordinates(self):
+        """Ensure only variables with a `coordinates` metadata attribute are
+        returned, omitting any that match the excluded science variables
+        defined in the associated instance of the `CFConfig` class.
+
+        """
+        dataset = self.mock_dmr_two_varinfo
+
+        variables_with_coordinates = dataset.get_variables_with_coordinates()
+        self.assertSetEqual(
+            set(variables_with_coordinates.keys()), {'/science/interesting_thing'}
+        )
+
     def test_var_info_get_metadata_variables(self):
         """Ensure the correct set of metadata variables (those without
         coordinate references) is returned. This should exclude variables
@@ -427,7 +642,7 @@ class TestVarInfoFromDmr(TestCase):
         excluded by the `CFConfig` instance.
 
         """
-        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+        dataset = self.mock_dmr_two_varinfo
 
         metadata_variables = dataset.get_metadata_variables()
         self.assertSetEqual(metadata_variables, {'/required_group/has_no_coordinates'})
@@ -467,6 +682,21 @@ class TestVarInfoFromDmr(TestCase):
                 },
             )
 
+        with self.subTest('Requested variables are not modified'):
+            requested_variables = {'/science/interesting_thing'}
+            dataset.get_required_variables(requested_variables)
+            self.assertSetEqual(requested_variables, {'/science/interesting_thing'})
+
+        with self.subTest('Changes to variable references are reflected'):
+            dataset.get_variable('/science/interesting_thing').references.pop(
+                'coordinates'
+            )
+
+            self.assertSetEqual(
+                dataset.get_required_variables({'/science/interesting_thing'}),
+                {'/science/interesting_thing', '/required_group/has_no_coordinates'},
+            )
+
     def test_var_info_variable_is_excluded(self):
         """Ensure the a variable is correctly identified as being excluded or
         not, including when there are not exclusions for the collection.
@@ -474,14 +704,13 @@ class TestVarInfoFromDmr(TestCase):
         """
         variable = 'variable_name'
         test_args = [
-            ['No exclusions', '', variable, False],
-            ['Not excluded', 'not_var', variable, False],
-            ['Excluded', 'var', variable, True],
+            ['No exclusions', re.compile(''), variable, False],
+            ['Not excluded', re.compile('not_var'), variable, False],
+            ['Excluded', re.compile('var'), variable, True],
         ]
 
-        for description, pattern, variable_name, expected_result in test_args:
+        for description, re_pattern, variable_name, expected_result in test_args:
             with self.subTest(description):
-                re_pattern = re.compile(pattern)
                 result = VarInfoFromDmr.variable_is_excluded(variable_name, re_pattern)
 
                 self.assertEqual(result, expected_result)
@@ -499,11 +728,15 @@ class TestVarInfoFromDmr(TestCase):
             '/other_science',
             '/FakeDim1234',
             '/nested/FakeDim0',
+            '/FakeDimension',
         }
 
         required_variables = VarInfoFromDmr.exclude_fake_dimensions(input_variables)
 
-        self.assertSetEqual(required_variables, {'/science_variable', '/other_science'})
+        self.assertSetEqual(
+            required_variables,
+            {'/science_variable', '/other_science', '/FakeDimension'},
+        )
 
     def test_get_variable(self):
         """Ensure a variable, both with or without, coordinates can be
@@ -511,7 +744,7 @@ class TestVarInfoFromDmr(TestCase):
         ensure `None` is returned.
 
         """
-        dataset = VarInfoFromDmr(self.mock_dmr_two, config_file=self.test_config_file)
+        dataset = self.mock_dmr_two_varinfo
 
         with self.subTest('A variable with coordinates'):
             science_variable = dataset.get_variable('/science/interesting_thing')
@@ -540,35 +773,10 @@ class TestVarInfoFromDmr(TestCase):
         have an associated variable, will not be returned.
 
         """
-        mock_dmr = (
-            f'<Dataset xmlns="{self.namespace}">'
-            '  <Attribute name="short_name">'
-            '    <Value>FAKE123A</Value>'
-            '  </Attribute>'
-            '  <Dimension name="latitude" size="1800"/>'
-            '  <Dimension name="longitude" size="3600"/>'
-            '  <Float64 name="science_one">'
-            '    <Dim name="/latitude"/>'
-            '  </Float64>'
-            '  <Float64 name="science_two">'
-            '    <Dim name="/longitude"/>'
-            '  </Float64>'
-            '  <Float64 name="science_three">'
-            '  </Float64>'
-            '  <Float64 name="longitude">'
-            '  </Float64>'
-            '  <Float64 name="latitude">'
-            '  </Float64>'
-            '  <Float64 name="lat_bnds">'
-            '    <Dim name="latv" size="2"/>'
-            '    <Dim name="latitude" size="1800"/>'
-            '  </Float64>'
-            '</Dataset>'
+        dataset = VarInfoFromDmr.from_string(
+            self.required_dimensions_dmr, config_file=self.test_config_file
         )
 
-        dmr_path = write_dmr(self.output_dir, mock_dmr)
-        dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
-
         with self.subTest('All dimensions are retrieved'):
             self.assertSetEqual(
                 dataset.get_required_dimensions({'/science_one', '/science_two'}),
@@ -590,14 +798,20 @@ class TestVarInfoFromDmr(TestCase):
                 dataset.get_required_dimensions({'/lat_bnds'}), {'/latitude'}
             )
 
+        with self.subTest('Changes to variable dimensions are reflected'):
+            dataset.get_variable('/science_two').dimensions = []
+
+            self.assertSetEqual(
+                dataset.get_required_dimensions({'/science_one', '/science_two'}),
+                {'/latitude'},
+            )
+
     def test_get_spatial_dimensions(self):
         """Ensure all horizontal spatial dimensions are returned, both
         geographic and projected.
 
         """
-        dataset = VarInfoFromDmr(
-            self.mock_geo_and_projected_dmr, config_file=self.test_config_file
-        )
+        dataset = self.mock_geo_and_projected_varinfo
 
         with self.subTest('All horizontal spatial variables are returned'):
             self.assertSetEqual(
@@ -628,9 +842,7 @@ class TestVarInfoFromDmr(TestCase):
         error.
 
         """
-        dataset = VarInfoFromDmr(
-            self.mock_geo_and_projected_dmr, config_file=self.test_config_file
-        )
+        dataset = self.mock_geo_and_projected_varinfo
 
         with self.subTest('All (and only) geographic variables are returned'):
             self.assertSetEqual(
@@ -667,9 +879,7 @@ class TestVarInfoFromDmr(TestCase):
         cause an error.
 
         """
-        dataset = VarInfoFromDmr(
-            self.mock_geo_and_projected_dmr, config_file=self.test_config_file
-        )
+        dataset = self.mock_geo_and_projected_varinfo
 
         with self.subTest('All (and only) projected dimension variables are returned'):
             self.assertSetEqual(
@@ -705,56 +915,10 @@ class TestVarInfoFromDmr(TestCase):
         dimension is misnamed, the method will not cause an error.
 
         """
-        mock_dmr = (
-            f'<Dataset xmlns="{self.namespace}">'
-            '  <Attribute name="short_name">'
-            '    <Value>FAKE123A</Value>'
-            '  </Attribute>'
-            '    <Float64 name="science_one">'
-            '      <Dim name="/latitude"/>'
-            '      <Dim name="/longitude"/>'
-            '      <Dim name="/time"/>'
-            '    </Float64>'
-            '    <Float64 name="science_two">'
-            '      <Dim name="x"/>'
-            '      <Dim name="y"/>'
-            '    </Float64>'
-            '    <Float64 name="science_three">'
-            '    </Float64>'
-            '    <Float64 name="science_four">'
-            '      <Dim name="non-existent"/>'
-            '    </Float64>'
-            '    <Int32 name="time">'
-            '      <Attribute name="units" type="String">'
-            '        <Value>minutes since 1980-01-02 00:30:00 </Value>'
-            '      </Attribute>'
-            '    </Int32>'
-            '    <Float64 name="latitude">'
-            '      <Attribute name="units" type="String">'
-            '        <Value>degrees_north</Value>'
-            '      </Attribute>'
-            '    </Float64>'
-            '    <Float64 name="longitude">'
-            '      <Attribute name="units" type="String">'
-            '        <Value>degrees_east</Value>'
-            '      </Attribute>'
-            '    </Float64>'
-            '    <Float64 name="x">'
-            '      <Attribute name="units" type="String">'
-            '        <Value>m</Value>'
-            '      </Attribute>'
-            '    </Float64>'
-            '    <Float64 name="y">'
-            '      <Attribute name="units" type="String">'
-            '        <Value>m</Value>'
-            '      </Attribute>'
-            '    </Float64>'
-            '</Dataset>'
+        dataset = VarInfoFromDmr.from_string(
+            self.temporal_dimensions_dmr, config_file=self.test_config_file
         )
 
-        dmr_path = write_dmr(self.output_dir, mock_dmr)
-        dataset = VarInfoFromDmr(dmr_path, config_file=self.test_config_file)
-
         with self.subTest('All (and only) temporal variables are returned'):
             self.assertSetEqual(
                 dataset.get_temporal_dimensions({'/science_one', '/science_two'}),
@@ -787,9 +951,7 @@ class TestVarInfoFromDmr(TestCase):
         variable with only those dimensions.
 
         """
-        dataset = VarInfoFromDmr(
-            self.mock_geo_and_projected_dmr, config_file=self.test_config_file
-        )
+        dataset = self.mock_geo_and_projected_varinfo
 
         with self.subTest('Only geographically gridded variables are retrieved'):
             self.assertSetEqual(
@@ -810,9 +972,7 @@ class TestVarInfoFromDmr(TestCase):
 
     def test_group_variables_by_dimensions(self):
         """Ensure all variables are grouped according to their dimensions."""
-        dataset = VarInfoFromDmr(
-            self.dimension_grouping_dmr, config_file=self.test_config_file
-        )
+        dataset = self.dimension_grouping_varinfo
 
         expected_groups = {
             ('/time', '/latitude', '/longitude'): {'/science_one', '/science_two'},
@@ -833,7 +993,15 @@ class TestVarInfoFromDmr(TestCase):
             },
         }
 
-        self.assertDictEqual(dataset.group_variables_by_dimensions(), expected_groups)
+        grouped_variables = dataset.group_variables_by_dimensions()
+        self.assertDictEqual(grouped_variables, expected_groups)
+
+        with self.subTest('Dimension paths are the same objects as variable paths'):
+            variable_paths = {path: path for path in dataset.variables}
+
+            for dimensions in grouped_variables:
+                for dimension in dimensions:
+                    self.assertIs(dimension, variable_paths[dimension])
 
     def test_group_variables_by_horizontal_dimensions(self):
         """Ensure all variables are grouped according to their horizontal
@@ -841,9 +1009,7 @@ class TestVarInfoFromDmr(TestCase):
         same dimensions in a different order are not grouped together.
 
         """
-        dataset = VarInfoFromDmr(
-            self.dimension_grouping_dmr, config_file=self.test_config_file
-        )
+        dataset = self.dimension_grouping_varinfo
 
         expected_groups = {
             ('/latitude', '/longitude'): {
@@ -905,6 +1071,10 @@ class TestVarInfoFromDmr(TestCase):
         # Check that a science variable returns True
         self.assertTrue(dataset.is_science_variable(science_variable))
 
+        # Check that a bounds variable with spatial dimensions returns False
+        bounds_variable = self.mock_dmr_two_varinfo.get_variable('/science/lat_bnds')
+        self.assertFalse(self.mock_dmr_two_varinfo.is_science_variable(bounds_variable))
+
     def test_get_missing_variable_attributes(self):
         """Ensure that CF attributes for a variable is returned even if
         the variable is not present in the source granule or dmrpp file
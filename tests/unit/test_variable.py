@@ -517,6 +517,21 @@ class TestVariableFromDmr(TestCase):
 
                 self.assertFalse(variable.is_geographic())
 
+        with self.subTest('Multi-valued units are not geographic'):
+            variable_tree = ET.fromstring(
+                f'<{self.namespace}Float64 name="variable_name">'
+                f'  <{self.namespace}Attribute name="units" type="String">'
+                f'    <{self.namespace}Value>degrees_north</{self.namespace}Value>'
+                f'    <{self.namespace}Value>degrees_east</{self.namespace}Value>'
+                f'  </{self.namespace}Attribute>'
+                f'</{self.namespace}Float64>'
+            )
+            variable = VariableFromDmr(
+                variable_tree, self.fakesat_config, self.namespace, '/variable'
+            )
+
+            self.assertFalse(variable.is_geographic())
+
     def test_is_latitude(self):
         """Ensure that a varaible is correctly identified a latitudinal based
         on its `units` metadata attribute.
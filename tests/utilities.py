@@ -23,20 +23,6 @@ def is_dictionary_subset(subset_dict: Dict, container_dict: Dict) -> bool:
     )
 
 
-def write_dmr(output_dir: str, content: str):
-    """A helper function to write out the content of a `.dmr`, which will be
-    used as inputs to tests using `VarInfoFromDmr`. This will be called as
-    a side-effect to the mock for that function.
-
-    """
-    dmr_name = f'{output_dir}/downloaded.dmr'
-
-    with open(dmr_name, 'w', encoding='utf-8') as file_handler:
-        file_handler.write(content)
-
-    return dmr_name
-
-
 def write_skeleton_netcdf4(output_dir: str) -> str:
     """A helper function to write a skeletal NetCDF-4 file that contains
     global attributes, variables (nested and in the root group) with
@@ -9,13 +9,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from typing import Any, Union
+import sys
 import xml.etree.ElementTree as ET
 
 from netCDF4 import Group as NetCDF4Group
 from netCDF4 import Variable as NetCDF4Variable
 
 from varinfo.cf_config import CFConfig
-from varinfo.utilities import get_xml_attribute
+from varinfo.utilities import get_xml_attribute, parse_xml_attribute
 
 
 InputContainerType = Union[ET.Element, NetCDF4Group, NetCDF4Variable]
@@ -37,9 +38,12 @@ class AttributeContainerBase(ABC):
         """Extract metadata attributes, including any overrides defined in the
         supplied `CFConfig` instance.
 
+        The full path is interned, as the same path is used as a key in many
+        dictionaries and sets of the owning `VarInfo` instance.
+
         """
         self.namespace = namespace
-        self.full_name_path = full_name_path
+        self.full_name_path = sys.intern(full_name_path)
         self.metadata_overrides = cf_config.get_metadata_overrides(self.full_name_path)
         self.attributes = self._get_attributes(container)
         self._add_additional_attributes()
@@ -111,14 +115,22 @@ class AttributeContainerFromDmr(AttributeContainerBase):
 
     def _get_attributes(self, container: ET.Element) -> dict[str, Any]:
         """Locate all child Attribute elements of the container and extract
-        their associated values.
+        their associated values. Each Attribute element is parsed directly,
+        rather than searching the container again by attribute name. If an
+        attribute name is repeated, the first element is retained.
 
         """
-        return {
-            attribute.get('name'): self._get_attribute(container, attribute.get('name'))
-            for attribute in container.findall(f'{self.namespace}Attribute')
-            if attribute.get('name') is not None
-        }
+        attributes = {}
+
+        for attribute in container.findall(f'{self.namespace}Attribute'):
+            attribute_name = attribute.get('name')
+
+            if attribute_name is not None and attribute_name not in attributes:
+                attributes[attribute_name] = self._get_configured_attribute(
+                    attribute_name, parse_xml_attribute(attribute, self.namespace)
+                )
+
+        return attributes
 
     def _get_attribute(self, container: ET.Element, attribute_name: str) -> Any:
         """Extract the value of an XML Attribute element, casting it to the
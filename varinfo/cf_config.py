@@ -31,6 +31,26 @@ from varinfo.exceptions import (
 )
 
 
+def read_config_file(config_file: str | None) -> dict[str, Any]:
+    """Read the main configuration JSON file. If no file is specified, an
+    empty configuration is returned. A `MissingConfigurationFileError` is
+    raised if the file does not exist, and an `InvalidConfigFileFormatError`
+    is raised if the file is not JSON.
+
+    """
+    if config_file is not None and not exists(config_file):
+        raise MissingConfigurationFileError(config_file)
+    elif config_file is not None and config_file.endswith('.json'):
+        with open(config_file, 'r', encoding='utf-8') as file_handler:
+            config = json.load(file_handler)
+    elif config_file is not None:
+        raise InvalidConfigFileFormatError(config_file)
+    else:
+        config = {}
+
+    return config
+
+
 class CFConfig:
     """This class should read the main configuration file,
     see e.g. sample_config.json, which defines overriding values for the
@@ -47,13 +67,18 @@ class CFConfig:
         mission: str | None,
         collection_short_name: str | None,
         config_file: str | None = None,
+        config: dict[str, Any] | None = None,
     ):
         """Set supplied class attributes. Then read the designated
         configuration file to obtain mission and short name specific
         attributes.
 
+        If the configuration file has already been parsed, its contents can
+        be supplied via `config`, so that the file is not read again.
+
         """
         self.config_file = config_file
+        self._config = config
         self.mission = mission
         self.short_name = collection_short_name
 
@@ -70,15 +95,10 @@ class CFConfig:
         instantiating the class.
 
         """
-        if self.config_file is not None and not exists(self.config_file):
-            raise MissingConfigurationFileError(self.config_file)
-        elif self.config_file is not None and self.config_file.endswith('.json'):
-            with open(self.config_file, 'r', encoding='utf-8') as file_handler:
-                config = json.load(file_handler)
-        elif self.config_file is not None:
-            raise InvalidConfigFileFormatError(self.config_file)
+        if self._config is not None:
+            config = self._config
         else:
-            config = {}
+            config = read_config_file(self.config_file)
 
         self.excluded_science_variables = {
             pattern
@@ -8,6 +8,8 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Literal
 import os.path
+import random
+import time
 
 from cmr import GranuleQuery, CMR_OPS, CMR_SIT, CMR_UAT
 import requests
@@ -29,6 +31,10 @@ urs_token_endpoints = {
     CMR_SIT: 'https://sit.urs.earthdata.nasa.gov/api/nams/edl_user_token',
 }
 
+# Transient server-side failures for which a granule download is retried:
+DOWNLOAD_RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+DOWNLOAD_MAX_ATTEMPTS = 3
+
 
 def get_granules(
     concept_id: str | None = None,
@@ -132,6 +138,13 @@ def download_granule(
       - A header with an EDL bearer token: 'Authorization: Bearer <token>'
     * out_directory: path to save downloaded granule
         (the default is the current directory).
+
+    Responses with a transient server-side error status code (e.g., 503) are
+    retried, up to `DOWNLOAD_MAX_ATTEMPTS` requests in total, with an
+    exponential backoff (plus jitter) between each attempt. If every attempt
+    fails with a transient error, a `GranuleDownloadException` is raised.
+    Connection errors and timeouts are not retried, and are also raised as a
+    `GranuleDownloadException`.
     """
     # Create `out_directory` if it does not exist and create out_filename
     if not os.path.isdir(out_directory):
@@ -143,11 +156,21 @@ def download_granule(
     out_filename = os.path.join(out_directory, os.path.basename(granule_link))
 
     try:
-        # Write content of data to out_filename and return response
-        response = requests.get(
-            granule_link, headers={'Authorization': auth_header}, timeout=10
-        )
+        for attempt in range(DOWNLOAD_MAX_ATTEMPTS):
+            response = requests.get(
+                granule_link, headers={'Authorization': auth_header}, timeout=10
+            )
 
+            if response.status_code not in DOWNLOAD_RETRY_STATUS_CODES:
+                break
+
+            if attempt == DOWNLOAD_MAX_ATTEMPTS - 1:
+                # Do not write the body of the final error response to disk
+                response.raise_for_status()
+
+            time.sleep(2**attempt + random.random())
+
+        # Write content of data to out_filename and return response
         with open(out_filename, 'wb') as file_download:
             file_download.write(response.content)
 
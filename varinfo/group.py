@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from typing import Union
+import sys
 import xml.etree.ElementTree as ET
 
 from netCDF4 import Group as NetCDF4Group
@@ -18,7 +19,7 @@ from varinfo.attribute_container import (
     AttributeContainerFromNetCDF4,
 )
 from varinfo.cf_config import CFConfig
-from varinfo.utilities import DAP4_TO_NUMPY_MAP
+from varinfo.utilities import get_dap4_variable_tags
 
 
 InputGroupType = Union[ET.Element, NetCDF4Group]
@@ -63,10 +64,14 @@ class GroupFromDmr(GroupBase, AttributeContainerFromDmr):
 
     def _parse_variables(self, group: ET.Element) -> set[str]:
         """Returns full paths of all child variables in the group."""
+        variable_tags = get_dap4_variable_tags(self.namespace)
+
         return {
-            '/'.join([self.full_name_path.rstrip('/'), child.get('name', '')])
+            sys.intern(
+                '/'.join([self.full_name_path.rstrip('/'), child.get('name', '')])
+            )
             for child in group
-            if child.tag.replace(self.namespace, '') in DAP4_TO_NUMPY_MAP
+            if child.tag in variable_tags
         }
 
 
@@ -79,6 +84,6 @@ class GroupFromNetCDF4(GroupBase, AttributeContainerFromNetCDF4):
     def _parse_variables(self, group: NetCDF4Group) -> set[str]:
         """Returns full paths of all child variables in the group."""
         return {
-            '/'.join([self.full_name_path.rstrip('/'), variable])
+            sys.intern('/'.join([self.full_name_path.rstrip('/'), variable]))
             for variable in group.variables
         }
@@ -78,6 +78,9 @@ UMM_VAR_DTYPES = [
     'OTHER',
 ]
 
+# Characters in a variable path that cannot be used in an output file name:
+UMM_VAR_FILE_NAME_TRANSLATION = str.maketrans({'/': '_', '\\': '_', ':': '_'})
+
 
 def get_all_umm_var(var_info: VarInfoBase) -> dict[str, dict]:
     """Iterate through all variables detected from the source granule and
@@ -141,7 +144,8 @@ def export_all_umm_var_to_json(umm_var_records: list, output_dir: str = '.'):
     files (one file per record).
 
     The output file name will be the full path of each variable will be the
-    full path of the variable, with any slashes replaced with underscores.
+    full path of the variable, with any slashes (or other characters that
+    are not valid in a file name) replaced with underscores.
 
     """
     for umm_var_record in umm_var_records:
@@ -155,7 +159,8 @@ def export_umm_var_to_json(umm_var_record: dict, output_dir: str = '.'):
     created.
 
     The output file name will be the full path of the variable, with any
-    slashes replaced with underscores.
+    slashes (or other characters that are not valid in a file name) replaced
+    with underscores.
 
     """
     if isfile(output_dir):
@@ -164,9 +169,10 @@ def export_umm_var_to_json(umm_var_record: dict, output_dir: str = '.'):
         # `exists_ok=True` makes this a no-op for existing directories:
         makedirs(output_dir, exist_ok=True)
 
-    output_file_path = join_path(
-        output_dir, f'{umm_var_record["Name"].replace("/", "_")}.json'
+    output_file_name = (
+        umm_var_record['Name'].translate(UMM_VAR_FILE_NAME_TRANSLATION) + '.json'
     )
+    output_file_path = join_path(output_dir, output_file_name)
 
     with open(output_file_path, 'w', encoding='utf-8') as file_handler:
         json.dump(umm_var_record, file_handler, indent=2)
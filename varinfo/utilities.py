@@ -24,6 +24,7 @@ from typing import Any
 from xml.etree.ElementTree import Element
 import functools
 import re
+import sys
 
 from netCDF4 import Dataset as NetCDF4Dataset
 import numpy as np
@@ -63,18 +64,40 @@ DAP4_TO_NUMPY_MAP = {
     'URL': str,
 }
 
+# The root element of a DMR is a Dataset tag, prefixed with the namespace:
+DMR_ROOT_TAG_PATTERN = re.compile('(.+)Dataset')
+
 
 def recursive_get(input_dictionary: dict, keys: list[str]):
-    """Extract a value from an arbitrarily nested dictionary."""
-    try:
-        nested_value = functools.reduce(dict.get, keys, input_dictionary)
-    except TypeError:
-        # This catches when there is a missing intermediate key
-        nested_value = None
+    """Extract a value from an arbitrarily nested dictionary. If any key
+    along the path is missing, `None` is returned without searching further.
+
+    """
+    nested_value = input_dictionary
+
+    for key in keys:
+        if not isinstance(nested_value, dict):
+            # This catches when there is a missing intermediate key
+            return None
+
+        nested_value = nested_value.get(key)
 
     return nested_value
 
 
+@functools.lru_cache(maxsize=16)
+def get_dap4_variable_tags(namespace: str) -> frozenset[str]:
+    """Return the namespace-qualified XML tags for all DAP4 variable types.
+    These are built and interned once per namespace, so that element tags
+    can be compared directly, rather than first removing the namespace from
+    every tag.
+
+    """
+    return frozenset(
+        sys.intern(f'{namespace}{variable_type}') for variable_type in DAP4_TO_NUMPY_MAP
+    )
+
+
 def split_attribute_path(full_path: str) -> list[str]:
     """Take the full path to a metadata attribute and return the list of
     keys that locate that attribute within the global attributes.
@@ -91,7 +114,7 @@ def get_xml_namespace(root_element: Element) -> str:
     The root element of a dmr file is expected to be a Dataset tag.
 
     """
-    match = re.match('(.+)Dataset', root_element.tag)
+    match = DMR_ROOT_TAG_PATTERN.match(root_element.tag)
 
     if match:
         xml_namespace = match.groups()[0]
@@ -118,26 +141,54 @@ def get_xml_attribute(
     children, cast as the indicated type. Attributes that are containers of
     nested attributes will return a dictionary structure.
 
+    The name is compared directly, rather than included in an XPath predicate,
+    so that the same compiled path is reused for every attribute name.
+
     """
-    attribute_element = variable.find(
-        f'{namespace}Attribute' f'[@name="{attribute_name}"]'
+    attribute_element = next(
+        (
+            attribute
+            for attribute in variable.findall(f'{namespace}Attribute')
+            if attribute.get('name') == attribute_name
+        ),
+        None,
     )
 
     if attribute_element is not None:
-        value_type = attribute_element.get('type', 'String')
+        attribute_value = parse_xml_attribute(
+            attribute_element, namespace, default_value
+        )
+    else:
+        attribute_value = default_value
 
-        if value_type != 'Container':
-            attribute_value = get_xml_attribute_value(
-                attribute_element,
-                namespace,
-                value_type,
-                default_value,
-            )
-        else:
-            attribute_value = get_xml_container_attribute(attribute_element, namespace)
+    return attribute_value
+
+
+def parse_xml_attribute(
+    attribute_element: Element,
+    namespace: str,
+    default_value: Any | None = None,
+) -> Any | None:
+    """Extract the value of an XML Attribute element that has already been
+    located in a `.dmr`. This avoids a second search of the parent element
+    when iterating through all Attribute children. The returned value is cast
+    as the type indicated by the Attribute tag's `type` property.
+
+    Attributes that are containers of nested attributes will return a
+    dictionary structure.
+
+    """
+    value_type = attribute_element.get('type', 'String')
 
+    if value_type != 'Container':
+        attribute_value = get_xml_attribute_value(
+            attribute_element,
+            namespace,
+            value_type,
+            default_value,
+        )
     else:
-        attribute_value = default_value
+        attribute_value = get_xml_container_attribute(attribute_element, namespace)
 
     return attribute_value
 
@@ -179,7 +230,7 @@ def get_xml_container_attribute(
     """
     attribute_dictionary = {}
 
-    for child in list(container_element):
+    for child in container_element:
         child_name = child.get('name')
         child_type = child.get('type', 'String')
 
@@ -7,19 +7,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from os.path import exists
 from typing import Any, Union
-import json
+import functools
 import re
+import sys
 import xml.etree.ElementTree as ET
 
 from netCDF4 import Dataset, Group
 
-from varinfo.cf_config import CFConfig
-from varinfo.exceptions import (
-    InvalidConfigFileFormatError,
-    MissingConfigurationFileError,
-)
+from varinfo.cf_config import CFConfig, read_config_file
 from varinfo.group import GroupFromDmr, GroupFromNetCDF4
 from varinfo.utilities import (
     DAP4_TO_NUMPY_MAP,
@@ -34,6 +30,17 @@ DimensionsGroupType = dict[tuple[str], set[str]]
 OutputGroupType = Union[GroupFromDmr, GroupFromNetCDF4]
 OutputVariableType = Union[VariableFromDmr, VariableFromNetCDF4]
 
+FAKE_DIMENSION_PATTERN = re.compile(r'/FakeDim\d')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regular expression, caching the result so that patterns
+    derived from the same configuration are only compiled once.
+
+    """
+    return re.compile(pattern)
+
 
 class VarInfoBase(ABC):
     """An abstract base class to represent the full dataset of a granule,
@@ -58,6 +65,16 @@ class VarInfoBase(ABC):
         dimensions, allowing the retrieval of all required variables for a
         specified list of science variables.
 
+        """
+        self._set_initial_attributes(short_name, config_file)
+        self._set_var_info_config()
+        self._read_dataset(file_path)
+        self._process_dataset()
+
+    def _set_initial_attributes(self, short_name: str | None, config_file: str | None):
+        """Set the initial values of the attributes that are populated while
+        reading a dataset and extracting its variables.
+
         """
         self.config_file = config_file
         self.short_name = short_name
@@ -68,8 +85,11 @@ class VarInfoBase(ABC):
         self.references: set[str] = set()
         self.metadata: dict[str, OutputVariableType] = {}
 
-        self._set_var_info_config()
-        self._read_dataset(file_path)
+    def _process_dataset(self):
+        """Once a dataset has been read, determine the collection short name
+        and mission, and extract all groups and variables from the dataset.
+
+        """
         self._set_mission_and_short_name()
         self.cf_config = self._set_cf_config()
         self._extract_variables()
@@ -105,23 +125,21 @@ class VarInfoBase(ABC):
         from short_name to satellite mission.
 
         """
-        if self.config_file is not None and not exists(self.config_file):
-            raise MissingConfigurationFileError(self.config_file)
-        elif self.config_file is not None and self.config_file.endswith('.json'):
-            with open(self.config_file, 'r', encoding='utf-8') as file_handler:
-                self.var_info_config = json.load(file_handler)
-        elif self.config_file is not None:
-            raise InvalidConfigFileFormatError(self.config_file)
-        else:
-            self.var_info_config = {}
+        self.var_info_config = read_config_file(self.config_file)
 
     def _set_cf_config(self) -> CFConfig:
         """Instantiate a CFConfig object, to contain any rules for exclusions,
         required fields and augmentations to CF attributes that are not
-        contained within a granule from the specified collection.
+        contained within a granule from the specified collection. The
+        configuration file contents that were already read are reused.
 
         """
-        return CFConfig(self.mission, self.short_name, self.config_file)
+        return CFConfig(
+            self.mission,
+            self.short_name,
+            self.config_file,
+            config=self.var_info_config,
+        )
 
     def _set_mission_and_short_name(self):
         """Check a series of potential locations for the collection short name
@@ -168,15 +186,13 @@ class VarInfoBase(ABC):
         variable in the configuration file supplied to the object.
 
         """
-        exclusion_pattern = re.compile(
-            '|'.join(self.cf_config.excluded_science_variables)
-        )
+        exclusions_pattern = self._get_exclusions_pattern()
 
         return {
             variable_path: variable
             for variable_path, variable in self.variables.items()
             if variable.references.get('coordinates') is not None
-            and not self.variable_is_excluded(variable, exclusion_pattern)
+            and not self.variable_is_excluded(variable_path, exclusions_pattern)
         }
 
     def _is_spatial_temporal_dimension(self, dimension_path: str) -> bool:
@@ -197,22 +213,24 @@ class VarInfoBase(ABC):
         geographic, temporal, and or projected spatial dimensions, or
         a coordinate or grid mapping reference attribute.
 
-        """
-        if any(
-            self._is_spatial_temporal_dimension(dimension)
-            for dimension in variable.dimensions
-            if dimension != variable.full_name_path
-            and not variable.full_name_path.endswith('_bnds')
-        ):
-            return True
+        The reference attributes are checked first, as they do not require
+        any of the dimension variables to be retrieved.
 
+        """
         if (
             variable.references.get('coordinates') is not None
             or variable.references.get('grid_mapping') is not None
         ):
             return True
 
-        return False
+        if variable.full_name_path.endswith('_bnds'):
+            return False
+
+        return any(
+            self._is_spatial_temporal_dimension(dimension)
+            for dimension in variable.dimensions
+            if dimension != variable.full_name_path
+        )
 
     def get_science_variables(self) -> set[str]:
         """Retrieve a set of names for all variables that have coordinate
@@ -220,9 +238,7 @@ class VarInfoBase(ABC):
         or ancillary date for another variable.
 
         """
-        exclusions_pattern = re.compile(
-            '|'.join(self.cf_config.excluded_science_variables)
-        )
+        exclusions_pattern = self._get_exclusions_pattern()
 
         filtered_with_coordinates = {
             variable_path
@@ -245,9 +261,7 @@ class VarInfoBase(ABC):
         variable.
 
         """
-        exclusions_pattern = re.compile(
-            '|'.join(self.cf_config.excluded_science_variables)
-        )
+        exclusions_pattern = self._get_exclusions_pattern()
 
         non_coordinate_variables = {
             variable_path
@@ -262,12 +276,23 @@ class VarInfoBase(ABC):
 
         return non_coordinate_variables - self.references
 
+    def _get_exclusions_pattern(self) -> re.Pattern:
+        """Combine the excluded science variables for the collection into a
+        single regular expression. The compiled pattern is cached, so that
+        repeated calls for the same configuration do not recompile it.
+
+        """
+        return _compile_pattern(
+            '|'.join(sorted(self.cf_config.excluded_science_variables))
+        )
+
     @staticmethod
     def variable_is_excluded(
         variable_name: str, exclusions_pattern: re.Pattern
     ) -> bool:
         """Ensure the variable name does not match any collection specific
-        exclusion rules.
+        exclusion rules. The exclusion pattern must already be compiled, as
+        this check is made for every variable in the granule.
 
         """
         if exclusions_pattern.pattern != '':
@@ -287,16 +312,20 @@ class VarInfoBase(ABC):
         variables for the collection, as indicated by the CFConfig class
         instance, and any references within those variables.
 
+        The input set is not modified.
+
         """
+        requested_variables = set(requested_variables)
+
         if self.cf_config.required_variables:
-            cf_required_pattern = re.compile(
-                '|'.join(self.cf_config.required_variables)
+            cf_required_pattern = _compile_pattern(
+                '|'.join(sorted(self.cf_config.required_variables))
             )
 
             cf_required_variables = {
                 variable
-                for variable in self.get_all_variables()
-                if variable is not None and re.match(cf_required_pattern, variable)
+                for variable in self.variables
+                if cf_required_pattern.match(variable)
             }
         else:
             cf_required_variables = set()
@@ -354,22 +383,17 @@ class VarInfoBase(ABC):
         list of supported metadata attributes can be found in
         varinfo.utilities::CF_REFERENCE_ATTRIBUTES
 
-        Iterate through all requested variables and extract a list of
-        references for the metadata attribute. This will produce a list of lists,
-        which should be flattened into a single list and then combined into a set
-        to remove duplicates.
+        Iterate through all requested variables and combine their sets of
+        references for the metadata attribute into a single set, which
+        removes duplicates. Variables without the attribute contribute no
+        references.
 
         """
-        reference_set = [
-            self.get_variable(variable).references.get(reference_attribute_name)
-            for variable in list_of_variables
-            if self.get_variable(variable).references.get(reference_attribute_name)
-            is not None
-        ]
-        return set(
-            variable_reference
-            for variable_references in reference_set
-            for variable_reference in variable_references
+        return set().union(
+            *(
+                self.get_variable(variable).references.get(reference_attribute_name, ())
+                for variable in list_of_variables
+            )
         )
 
     def get_spatial_dimensions(self, variables: set[str]) -> set[str]:
@@ -377,11 +401,16 @@ class VarInfoBase(ABC):
         dimensions for any of the input variables, and that are horizontal
         spatial dimensions (either geographic or projected).
 
+        The required dimensions are retrieved, and each dimension variable
+        looked up, only once, rather than once each for the geographic and
+        projected checks.
+
         """
-        return set().union(
-            self.get_geographic_spatial_dimensions(variables),
-            self.get_projected_spatial_dimensions(variables),
-        )
+        return {
+            dimension
+            for dimension in self.get_required_dimensions(variables)
+            if self._is_horizontal_spatial_dimension(dimension)
+        }
 
     def get_geographic_spatial_dimensions(self, variables: set[str]) -> set[str]:
         """Return a single set of all the variables that are both used as
@@ -431,11 +460,11 @@ class VarInfoBase(ABC):
         dimensions as a subset of their own dimensions.
 
         """
-        return set(
-            variable
-            for variable in self.get_all_variables()
-            if dimensions.issubset(set(self.get_variable(variable).dimensions))
-        )
+        return {
+            variable_path
+            for variable_path, variable in self.variables.items()
+            if dimensions.issubset(variable.dimensions)
+        }
 
     def group_variables_by_dimensions(self) -> DimensionsGroupType:
         """Retrieve a dictionary that groups all variables in a file by the
@@ -452,19 +481,17 @@ class VarInfoBase(ABC):
         }
         ```
 
+        The dimension paths in each key are interned when the variables are
+        parsed, so keys share their strings with the variable paths, rather
+        than holding copies.
+
         """
         grouped_variables = {}
 
-        for variable_name in self.get_all_variables():
-            variable = self.get_variable(variable_name)
-            variable_dimensions = tuple(variable.dimensions)
-
-            if variable_dimensions in grouped_variables:
-                grouped_variables[variable_dimensions].add(variable_name)
-            else:
-                grouped_variables[variable_dimensions] = {
-                    variable_name,
-                }
+        for variable_name, variable in self.variables.items():
+            grouped_variables.setdefault(tuple(variable.dimensions), set()).add(
+                variable_name
+            )
 
         return grouped_variables
 
@@ -477,22 +504,25 @@ class VarInfoBase(ABC):
         considered, so variables with dimensions (lat, lon) will not be
         grouped with variables having dimensions (lon, lat).
 
+        Each distinct dimension is only checked once, as most dimensions
+        appear in the keys of many groups.
+
         """
         grid_groups = self.group_variables_by_dimensions()
 
+        horizontal_dimension_paths = {
+            dimension
+            for dimension in set().union(*grid_groups)
+            if self._is_horizontal_spatial_dimension(dimension)
+        }
+
         horizontal_groups = {}
 
         for grid_dimensions, variables in grid_groups.items():
             horizontal_dimensions = tuple(
                 dimension
                 for dimension in grid_dimensions
-                if (
-                    self.get_variable(dimension) is not None
-                    and (
-                        self.get_variable(dimension).is_geographic()
-                        or self.get_variable(dimension).is_projection_x_or_y()
-                    )
-                )
+                if dimension in horizontal_dimension_paths
             )
 
             if horizontal_dimensions in horizontal_groups:
@@ -502,6 +532,20 @@ class VarInfoBase(ABC):
 
         return horizontal_groups
 
+    def _is_horizontal_spatial_dimension(self, dimension: str) -> bool:
+        """Determine if a dimension path refers to a variable that is a
+        horizontal spatial dimension, either geographic or projected. The
+        dimension variable is only looked up once. Dimensions without a
+        variable are not considered spatial.
+
+        """
+        dimension_variable = self.get_variable(dimension)
+
+        return dimension_variable is not None and (
+            dimension_variable.is_geographic()
+            or dimension_variable.is_projection_x_or_y()
+        )
+
     @staticmethod
     def exclude_fake_dimensions(variable_set: set[str]) -> set[str]:
         """An OPeNDAP `.dmr` can contain fake dimensions, used to supplement
@@ -509,11 +553,14 @@ class VarInfoBase(ABC):
         requesting a subset from an OPeNDAP server, and must be removed
         from the list of required variables.
 
-        """
-        fakedim_pattern = re.compile(r'.*/FakeDim\d+')
+        A substring check is used first, so that the regular expression is
+        only evaluated for the few paths that could be fake dimensions.
 
+        """
         return {
-            variable for variable in variable_set if not fakedim_pattern.match(variable)
+            variable
+            for variable in variable_set
+            if '/FakeDim' not in variable or not FAKE_DIMENSION_PATTERN.search(variable)
         }
 
 
@@ -524,6 +571,28 @@ class VarInfoFromDmr(VarInfoBase):
 
     """
 
+    @classmethod
+    def from_string(
+        cls,
+        dmr_content: str,
+        short_name: str | None = None,
+        config_file: str | None = None,
+    ) -> VarInfoFromDmr:
+        """Create an instance of `VarInfoFromDmr` from the content of an
+        OPeNDAP `.dmr`, for example a response already held in memory. This
+        avoids needing to first write the `.dmr` to disk. The constructor is
+        bypassed, as it expects the path to a `.dmr` file, but the instance is
+        otherwise set up in the same way.
+
+        """
+        var_info = cls.__new__(cls)
+        var_info._set_initial_attributes(short_name, config_file)
+        var_info._set_var_info_config()
+        var_info.dataset = ET.fromstring(dmr_content)
+        var_info.namespace = get_xml_namespace(var_info.dataset)
+        var_info._process_dataset()
+        return var_info
+
     def _read_dataset(self, file_path: str):
         """Extract the XML tree and namespace from an OPeNDAP `.dmr` file."""
         with open(file_path, 'r', encoding='utf-8') as file_handler:
@@ -624,15 +693,21 @@ class VarInfoFromDmr(VarInfoBase):
 
         group_path = group_path.rstrip('/')
 
-        for child in list(element):
+        # Qualify the tags once, rather than removing the namespace from the
+        # tag of every child element:
+        qualified_element_types = {
+            sys.intern(f'{self.namespace}{element_type}')
+            for element_type in element_types
+        }
+        group_tag = sys.intern(f'{self.namespace}Group')
+
+        for child in element:
             # If it is in the DAP4 list: use the function
             # else, if it is a Group, assign to dictionary and call this
             # function again
-            element_type = child.tag.replace(self.namespace, '')
-
-            if element_type in element_types:
+            if child.tag in qualified_element_types:
                 operation(output, group_path, child)
-            elif element_type == 'Group':
+            elif child.tag == group_tag:
                 new_group_path = '/'.join([group_path, child.get('name')])
 
                 self.traverse_elements(
@@ -9,6 +9,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from typing import Union
 import re
+import sys
 import xml.etree.ElementTree as ET
 
 from netCDF4 import Variable as NetCDF4Variable
@@ -24,6 +25,30 @@ from varinfo.utilities import CF_REFERENCE_ATTRIBUTES
 
 InputVariableType = Union[ET.Element, NetCDF4Variable]
 
+# Units for geographic coordinates, see sections 4.1 and 4.2 of the CF
+# Conventions (v1.8):
+CF_LATITUDE_UNITS = frozenset(
+    {'degrees_north', 'degree_north', 'degrees_N', 'degree_N', 'degreesN', 'degreeN'}
+)
+CF_LONGITUDE_UNITS = frozenset(
+    {'degrees_east', 'degree_east', 'degrees_E', 'degree_E', 'degreesE', 'degreeE'}
+)
+
+# Standard names for projected horizontal spatial coordinates, including those
+# of geostationary projections (CF Conventions v1.9):
+CF_PROJECTED_STANDARD_NAMES = frozenset(
+    {
+        'projection_x_coordinate',
+        'projection_x_angular_coordinate',
+        'projection_y_coordinate',
+        'projection_y_angular_coordinate',
+    }
+)
+
+# References in CF-Convention attributes, and dimension overrides, are
+# separated by whitespace, commas or both:
+REFERENCE_SEPARATOR_PATTERN = re.compile(r'\s+|,\s*')
+
 
 class VariableBase(AttributeContainerBase):
     """A class to represent a single variable contained within a granule
@@ -156,14 +181,8 @@ class VariableBase(AttributeContainerBase):
         as defined in section 4.1 of the CF Conventions (v1.8).
 
         """
-        return self.attributes.get('units') in [
-            'degrees_north',
-            'degree_north',
-            'degrees_N',
-            'degree_N',
-            'degreesN',
-            'degreeN',
-        ]
+        units = self.attributes.get('units')
+        return isinstance(units, str) and units in CF_LATITUDE_UNITS
 
     def is_longitude(self) -> bool:
         """Determine if the variable is a longitude based on the `units`
@@ -171,14 +190,8 @@ class VariableBase(AttributeContainerBase):
         as defined in section 4.2 of the CF Conventions (v1.8).
 
         """
-        return self.attributes.get('units') in [
-            'degrees_east',
-            'degree_east',
-            'degrees_E',
-            'degree_E',
-            'degreesE',
-            'degreeE',
-        ]
+        units = self.attributes.get('units')
+        return isinstance(units, str) and units in CF_LONGITUDE_UNITS
 
     def is_projection_x_or_y(self) -> bool:
         """Determine if the variable is a projected x or y horizontal spatial
@@ -190,12 +203,11 @@ class VariableBase(AttributeContainerBase):
         `projection_y_angular_coordinate`.
 
         """
-        return self.attributes.get('standard_name') in [
-            'projection_x_coordinate',
-            'projection_x_angular_coordinate',
-            'projection_y_coordinate',
-            'projection_y_angular_coordinate',
-        ]
+        standard_name = self.attributes.get('standard_name')
+        return (
+            isinstance(standard_name, str)
+            and standard_name in CF_PROJECTED_STANDARD_NAMES
+        )
 
     def is_temporal(self) -> bool:
         """Determine if the variable is a time based on the `units`
@@ -233,7 +245,7 @@ class VariableBase(AttributeContainerBase):
 
         """
         if attribute_string is not None:
-            raw_references = re.split(r'\s+|,\s*', attribute_string)
+            raw_references = REFERENCE_SEPARATOR_PATTERN.split(attribute_string)
             references = set(self._qualify_references(raw_references))
         else:
             references = set()
@@ -251,7 +263,7 @@ class VariableBase(AttributeContainerBase):
         dimensions_override = self.metadata_overrides.get('dimensions')
 
         if dimensions_override is not None:
-            dimensions = re.split(r'\s+|,\s*', dimensions_override)
+            dimensions = REFERENCE_SEPARATOR_PATTERN.split(dimensions_override)
         else:
             dimensions = [
                 dimension
@@ -270,6 +282,9 @@ class VariableBase(AttributeContainerBase):
         metadata attribute. E.g. "crs: grid_y crs: grid_x" (See section 5.6
         of CF-Conventions).
 
+        The absolute paths are interned, so that they share storage with the
+        full paths of the variables they refer to.
+
         """
         references = []
 
@@ -290,7 +305,7 @@ class VariableBase(AttributeContainerBase):
                     # Reference is in the same group as this variable
                     absolute_path = '/'.join([self.group_path, reference])
 
-                references.append(absolute_path)
+                references.append(sys.intern(absolute_path))
 
         else:
             for reference in raw_references:
@@ -301,7 +316,7 @@ class VariableBase(AttributeContainerBase):
                 else:
                     absolute_path = f'/{reference}'
 
-                references.append(absolute_path)
+                references.append(sys.intern(absolute_path))
 
         return references
 